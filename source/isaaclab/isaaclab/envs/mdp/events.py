@@ -1071,23 +1071,22 @@ def reset_root_state_uniform(
     """
     # extract the used quantities (to enable type-hinting)
     asset: RigidObject | Articulation = env.scene[asset_cfg.name]
-    # get default root state
-    root_states = asset.data.default_root_state[env_ids].clone()
+    # get default root state (only read below, no clone needed)
+    root_states = asset.data.default_root_state[env_ids]
 
-    # poses
-    range_list = [pose_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
+    # sample poses and velocities together
+    keys = ["x", "y", "z", "roll", "pitch", "yaw"]
+    range_list = [pose_range.get(key, (0.0, 0.0)) for key in keys]
+    range_list += [velocity_range.get(key, (0.0, 0.0)) for key in keys]
     ranges = torch.tensor(range_list, device=asset.device)
-    rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=asset.device)
+    rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 12), device=asset.device)
 
+    # poses
     positions = root_states[:, 0:3] + env.scene.env_origins[env_ids] + rand_samples[:, 0:3]
     orientations_delta = math_utils.quat_from_euler_xyz(rand_samples[:, 3], rand_samples[:, 4], rand_samples[:, 5])
     orientations = math_utils.quat_mul(root_states[:, 3:7], orientations_delta)
     # velocities
-    range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
-    ranges = torch.tensor(range_list, device=asset.device)
-    rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=asset.device)
-
-    velocities = root_states[:, 7:13] + rand_samples
+    velocities = root_states[:, 7:13] + rand_samples[:, 6:12]
 
     # set into the physics simulation
     asset.write_root_pose_to_sim(torch.cat([positions, orientations], dim=-1), env_ids=env_ids)
@@ -1123,8 +1122,8 @@ def reset_root_state_with_random_orientation(
     """
     # extract the used quantities (to enable type-hinting)
     asset: RigidObject | Articulation = env.scene[asset_cfg.name]
-    # get default root state
-    root_states = asset.data.default_root_state[env_ids].clone()
+    # get default root state (only read below, no clone needed)
+    root_states = asset.data.default_root_state[env_ids]
 
     # poses
     range_list = [pose_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z"]]